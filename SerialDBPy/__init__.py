@@ -1,2 +1,3 @@
 from .serialization import Serializable
-from .query import iQuery
\ No newline at end of file
+from .query import iQuery
+from .templates import compile_template
\ No newline at end of file
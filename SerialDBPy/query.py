@@ -1,8 +1,12 @@
 from typing import Any, Optional
+from contextlib import contextmanager
 from snowflake.connector import DictCursor
+from snowflake.connector.errors import OperationalError, InterfaceError
 
 import snowflake.connector
 import os
+import queue
+import time
 
 class Connection(object):
 
@@ -12,45 +16,264 @@ class Connection(object):
     params = {'CLIENT_SESSION_KEEP_ALIVE':True}
 
     connector = snowflake.connector.connect( user=user,password=pswd,account=account,session_parameters = params )
+    pool_size = int( os.environ.get( 'SerialDBPy_POOL_SIZE',32 ) ) # Idle connections kept open; extras are closed on checkin
+    pool = queue.LifoQueue( maxsize=pool_size ) # Idle connections handed out by checkout()
+    pool_pid = os.getpid() # Forked workers must not reuse the parent's sockets
+
+    @classmethod
+    def connect(cls):
+
+        return snowflake.connector.connect( user=cls.user,password=cls.pswd,account=cls.account,session_parameters = cls.params )
 
     @classmethod
     def reset_connection(cls):
 
-        Connection.connector = snowflake.connector.connect( user=cls.user,password=cls.pswd,account=cls.account,session_parameters = cls.params )
+        Connection.connector = cls.connect()
+
+    @classmethod
+    def checkout(cls):
+
+        """
+        Takes an idle connection from the pool, opening a new one if none are idle
+        """
+
+        if Connection.pool_pid != os.getpid():
+            Connection.pool = queue.LifoQueue( maxsize=cls.pool_size ) # The inherited sockets belong to the parent
+            Connection.pool_pid = os.getpid()
+
+        try:
+            return Connection.pool.get_nowait()
+        except queue.Empty:
+            return cls.connect()
+
+    @classmethod
+    def checkin(cls, connector, broken:bool = False):
+
+        """
+        Returns a connection to the pool; broken connections, and any beyond pool_size, are closed instead
+        """
+
+        if connector is None:
+            return
+
+        if not broken:
+
+            try:
+                return Connection.pool.put_nowait( connector )
+            except queue.Full:
+                pass
+
+        try:
+            connector.close()
+        except Exception:
+            pass # Already unusable
+
+    @classmethod
+    def close_pool(cls):
+
+        """
+        Closes every idle pooled connection
+        """
+
+        while True:
+
+            try:
+                connector = Connection.pool.get_nowait()
+            except queue.Empty:
+                return
+
+            cls.checkin( connector,broken=True )
 
 
 class iQuery(Connection):
 
     timeout = 5
+    retries = 3 # Attempts made on transient errors before re-raising
+    backoff = 0.5 # Seconds; doubles after every failed attempt
+    transient_errors = (OperationalError, InterfaceError)
 
-    def __init__(self):
+    def __init__(self, connector = None):
 
         self.cursor = None
         self.query_id = None
+        self.held = False # True while transaction() keeps one cursor open across calls
+        self.connector = connector # Defaults to the shared Connection.connector; iQuery.pooled() supplies one for parallel work
+
+    def open_cursor(self, reset:bool = False):
+
+        if reset and self.connector is None:
+            Connection.reset_connection()
+        elif reset:
+            Connection.checkin( self.connector,broken=True )
+            self.connector = Connection.connect()
+
+        self.cursor = ( self.connector or Connection.connector ).cursor(DictCursor)
+
+        return self.cursor
         
     def handle_cursor(func):
 
         def window(self,*args, **kwargs):
+
+            if self.held:
+                return func(self,*args, **kwargs)
             
             try:
-                self.cursor = Connection.connector.cursor(DictCursor)
+                self.open_cursor()
             except:
-                Connection.reset_connection()
-                self.cursor = Connection.connector.cursor(DictCursor)
-            
-            _r = func(self,*args, **kwargs)
-            self.cursor.close()
+                self.open_cursor( reset=True )
             
-            return _r
+            try:
+                return func(self,*args, **kwargs)
+            finally:
+                self.cursor.close()
         
         return window
+
+    def retry(self, call, idempotent:bool = False):
+
+        """
+        Runs call(), retrying transient errors with exponential backoff when the statement is idempotent
+        Other statements are never resent, since the server may already have applied them before the error
+        Errors inside of a transaction are re-raised since the open transaction cannot be replayed
+        """
+
+        attempts = max( self.retries,1 ) # The statement always runs at least once
+
+        for attempt in range( attempts ):
+
+            try:
+                return call()
+            except self.transient_errors as error:
+
+                if not idempotent or self.held or attempt == attempts - 1:
+                    raise
+
+                time.sleep( self.backoff * 2 ** attempt )
+
+                try:
+                    self.cursor.close()
+                except Exception:
+                    pass # The old cursor's connection is likely already gone
+
+                try:
+                    self.open_cursor( reset=True )
+                except Exception:
+                    raise error # Surface the transient error rather than the failed reconnect
+
+    @classmethod
+    @contextmanager
+    def pooled(cls):
+
+        """
+        Runs the block on a connection checked out of the pool
+        Whichever connection the query ends up holding is checked back in, and discarded if it failed
+
+        with iQuery.pooled() as q:
+            q.execute( sql='select 1' )
+        """
+
+        query = cls( connector=Connection.checkout() )
+        broken = False
+
+        try:
+            yield query
+        except cls.transient_errors:
+            broken = True
+            raise
+        finally:
+            Connection.checkin( query.connector,broken=broken )
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, connector = None):
+
+        """
+        Holds one cursor and transaction across every call made within the block
+        Commits when the block exits, rolls back if it raises
+        Runs on a dedicated pooled connection unless one is passed, so other threads' statements never join the transaction
+
+        with iQuery.transaction() as q:
+            q.execute( sql='delete from db.schema.table' )
+            q.execute( sql='insert into db.schema.table ...' )
+        """
+
+        query = cls( connector=connector or Connection.checkout() )
+        broken = False
+
+        try:
+
+            try:
+                query.open_cursor()
+            except:
+                query.open_cursor( reset=True )
+
+        except BaseException:
+
+            if connector is None:
+                Connection.checkin( query.connector,broken=True )
+
+            raise
+
+        query.held = True
+
+        try:
+            query.cursor.execute( 'begin transaction',timeout=cls.timeout )
+            yield query
+            query.cursor.execute( 'commit',timeout=cls.timeout )
+        except BaseException:
+
+            try:
+                query.cursor.execute( 'rollback',timeout=cls.timeout )
+            except Exception:
+                broken = True # Keep the original error; closing the connection ends the session and its transaction
+
+            raise
+        finally:
+            query.held = False
+            query.cursor.close()
+
+            if connector is None:
+                Connection.checkin( query.connector,broken=broken )
     
     @handle_cursor
-    def execute(self,sql:str = None,timeout:int = timeout ):
+    def execute(self,sql:str = None,timeout:int = timeout,idempotent:bool = False ):
+
+        """
+        :param idempotent: Retries transient errors; only pass True for statements that are safe to resend, such as selects
+        """
 
         #print( sql )
         
-        return self.cursor.execute(sql,timeout=timeout).fetchall()
+        return self.retry( lambda: self.cursor.execute(sql,timeout=timeout).fetchall(),idempotent=idempotent )
+
+    @handle_cursor
+    def execute_many(self,statements:list = None,timeout:int = timeout,idempotent:bool = False ):
+
+        """
+        Submits several statements in one request
+
+        :param statements: SQL statements, executed in order
+        :param idempotent: Retries transient errors; only pass True when every statement is safe to resend
+        :ret list: returns one list of rows per statement
+        """
+
+        statements = [ str( statement ).strip().rstrip( ';' ) for statement in statements or [] ]
+
+        if len( statements ) == 0:
+            return []
+
+        def submit():
+
+            self.cursor.execute( ';\n'.join( statements ),timeout=timeout,num_statements=len( statements ) )
+            results = [ self.cursor.fetchall() ]
+
+            while self.cursor.nextset():
+                results.append( self.cursor.fetchall() )
+
+            return results
+
+        return self.retry( submit,idempotent=idempotent )
     
     @handle_cursor
     def async_execute(self,sql:str = None,timeout:int=timeout):
@@ -1,8 +1,12 @@
-from typing import Optional
-from SerialDBPy.query import iQuery    
+from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from SerialDBPy.query import iQuery
+from SerialDBPy.templates import compile_template
 
 import os
+import json
 import uuid
+import tempfile
 
 class Serializable(object):
 
@@ -15,6 +19,8 @@ class Serializable(object):
     :class_param default_middleware: Default SQL query middleware; Ex: [database].[middleware].[table] 
     :class_param default_server: Default SQL query server; Ex: [database].[middleware].[table] 
     :class_param key_types: Different types of keys: Primary Key (PK), Foreign Key (FK), Composite Key (CK)
+    :class_param marker_types: Column markers within the resource_map; '<deferred>' lists columns loaded on first access
+    :class_param watermark_path: JSON file persisting sync_since() watermarks between runs
 
     :param resource_server: Servername or Warehouse; str
     :param resource_db: Database name; str
@@ -31,9 +37,11 @@ class Serializable(object):
 
     default_server = os.environ.get( 'default_server','' )
     default_middleware = os.environ.get( 'default_middleware','' )
+    watermark_path = os.environ.get( 'SerialDBPy_WATERMARKS','.serialdbpy_watermarks.json' )
     key_types = ('<pk>','<fk>','<ck>')
+    marker_types = ('<deferred>',)
 
-    __slots__ = '__dict__' if USE_SLOTS else None
+    __slots__ = ( '__dict__','_unloaded' ) if USE_SLOTS else None # _unloaded stays out of __dict__ so it never maps to a column
 
     def __init__(
             self, 
@@ -49,7 +57,7 @@ class Serializable(object):
         server = getattr(self,'resource_server',Serializable.default_server)
         db = getattr(self,'resource_db',None)
         table = getattr(self,'resource_table',None)
-        map = getattr(self,'resource_map',{})
+        map = { key:val for key,val in ( getattr(self,'resource_map',{}) or {} ).items() if key not in Serializable.marker_types }
         keys = [ key for key in map if key in Serializable.key_types ]
 
         _mapsize = len( map.keys() )
@@ -81,6 +89,9 @@ class Serializable(object):
                 replaced_underscores = { key[1:]:key[1:] for key,val in self.__dict__.items() if key[0] == '_' }
                 map = { **_keys,**map,**replaced_underscores }
 
+        for column in self._deferred_columns():
+            map.setdefault( column,column ) # Deferred columns stay mapped even when absent from the instance
+
         return server,db,table,map
     
     @classmethod
@@ -89,7 +100,7 @@ class Serializable(object):
         server = getattr(cls,'resource_server',Serializable.default_server)
         db = getattr(cls,'resource_db',None)
         table = getattr(cls,'resource_table',None)
-        map = getattr(cls,'resource_map',{})
+        map = { key:val for key,val in ( getattr(cls,'resource_map',{}) or {} ).items() if key not in Serializable.marker_types }
         
         keys = [ key for key in map if key in Serializable.key_types ]
 
@@ -123,6 +134,9 @@ class Serializable(object):
                 replaced_underscores = { key[1:]:key[1:] for key,val in instance.__dict__.items() if key[0] == '_' }
                 map = { **_keys,**map,**replaced_underscores }
 
+        for column in cls._deferred_columns():
+            map.setdefault( column,column ) # Deferred columns stay mapped even when absent from the instance
+
         return server,db,table,map
     
     def _valid_mapping(func):
@@ -240,6 +254,191 @@ class Serializable(object):
 
         return f' WHERE { " AND ".join( clauses ) }'
 
+    @classmethod
+    def _deferred_columns( cls ):
+
+        """
+        Returns the column names flagged as '<deferred>' in the resource_map
+        """
+
+        deferred = ( getattr( cls,'resource_map',{} ) or {} ).get( '<deferred>',() )
+
+        return ( deferred, ) if isinstance( deferred,str ) else tuple( deferred )
+
+    @staticmethod
+    def _projection( 
+        map:dict, 
+        columns:Optional[list] = None, 
+        deferred:tuple = () 
+    ):
+
+        """
+        Resolves which mapped columns a select should fetch
+
+        :param map: Resolved resource map
+        :param columns: Column or variable names to project; every non-deferred column when empty
+        :param deferred: Columns flagged as '<deferred>'
+        :ret tuple: ({column:var} to select, [vars left unloaded; deferred or projected out])
+        """
+
+        pk = map.get( '<pk>',None )
+        mapped = { key:val for key,val in map.items() if key not in Serializable.key_types }
+
+        if columns:
+            wanted = { str( column ).lower() for column in columns }
+            selected = { key:val for key,val in mapped.items() if str( key ).lower() in wanted or str( val ).lower() in wanted }
+        else:
+            selected = { key:val for key,val in mapped.items() if key not in deferred }
+
+        if isinstance( pk,str ) and ( columns or any( key not in selected for key in mapped ) ):
+            selected.setdefault( pk,map.get( pk,pk ) ) # Deferred loads are keyed on the primary key
+
+        unloaded = [ val for key,val in mapped.items() if key not in selected ] # Computed after the <pk> is added so the key is never unloaded
+
+        return selected,unloaded
+
+    def _set_from_row( self, row:dict ):
+
+        """
+        Sets the instance's variables from a query row
+        """
+
+        for key,val in row.items():
+
+            if Serializable.OVERRIDE_UNDERSCORE_WITH_PROPERTY and hasattr( self,f'_{key}'.lower() ):
+                setattr(self, f'_{key}'.lower() ,val)
+            else:
+                setattr(self, f'{key}'.lower() ,val)
+
+        return self
+
+    def _unloaded_vars( self ):
+
+        """
+        Returns the vars get()/get_all() left unloaded on this instance, mapped to the attribute that holds each one
+        """
+
+        try:
+            return object.__getattribute__( self,'_unloaded' )
+        except AttributeError:
+            return {}
+
+    def _mark_unloaded( self, vars:list ):
+
+        """
+        Removes vars that were not selected so they load on first access instead of keeping __init__ defaults
+        Vars backed by an underscore attribute (_name behind a name property) have the underscore attribute removed, as in _set_from_row()
+        """
+
+        unloaded = {}
+
+        for var in vars:
+
+            attr = f'_{var}' if Serializable.OVERRIDE_UNDERSCORE_WITH_PROPERTY and f'_{var}' in self.__dict__ else var
+            self.__dict__.pop( attr,None )
+            unloaded[var] = attr
+
+        self._unloaded = unloaded
+
+        return self
+
+    def __getattr__( self, name:str ):
+
+        """
+        Loads unloaded columns on first access; only reached when regular attribute lookup fails
+        (including a property whose underscore attribute was left unloaded)
+        Instances that were never read from the database are never loaded
+        """
+
+        unloaded = self._unloaded_vars()
+
+        if name.startswith( '__' ) or ( name not in unloaded and name not in unloaded.values() ):
+            raise AttributeError( f"'{type( self ).__name__}' object has no attribute '{name}'" )
+
+        type( self ).load_deferred( instances=[ self ] )
+
+        return getattr( self,name ) # The var is no longer unloaded, so this cannot reach __getattr__ for it again
+
+    @classmethod
+    def load_deferred( 
+        cls, 
+        instances:list, 
+        columns:Optional[list] = None, 
+        batch_size:int = 1000 
+    ):
+
+        """
+        Batch-loads the columns get()/get_all() left unloaded ('<deferred>' or projected out), one query per batch of primary keys
+
+        :param instances: Instances returned by get() or get_all()
+        :param columns: Columns to load; defaults to every column left unloaded on the instances
+        :param batch_size: Number of primary keys per IN clause
+        :ret list: returns the instances
+        """
+
+        instances = list( instances )
+
+        if len( instances ) == 0:
+            return instances
+
+        server,db,table,map = instances[0]._get_vars()
+
+        pk = map.get( '<pk>',None )
+        pk_var = map.get( pk,pk )
+        wanted = { map.get( column,column ) for column in columns } if columns else None
+        columns_of = { val:key for key,val in map.items() if key not in Serializable.key_types }
+        missing = {} # id(instance) -> (instance, {var:attr} it still needs)
+
+        for instance in instances:
+
+            vars = { var:attr for var,attr in instance._unloaded_vars().items() if attr not in instance.__dict__ and ( wanted is None or var in wanted ) }
+
+            if len( vars ) > 0:
+                missing[id( instance )] = ( instance,vars )
+
+        if len( missing ) == 0:
+            return instances
+
+        if not isinstance( pk,str ):
+            raise KeyError(f'Unloaded columns require a <pk> mapping for class type ({cls})')
+
+        pending = set().union( *[ vars for instance,vars in missing.values() ] )
+        n_map = [ f'{pk} as {pk_var}' ] + [ f'{columns_of.get( var,var )} as {var}' for var in sorted( pending ) if columns_of.get( var,var ) != pk ]
+        columns = ','.join(n_map)
+        by_key = {}
+
+        for instance,vars in missing.values():
+            # Read from __dict__ so a missing key can never re-enter __getattr__
+            key = instance.__dict__.get( pk_var,instance.__dict__.get( f'_{pk_var}',None ) )
+            by_key.setdefault( str( key ),[] ).append( ( instance,vars ) )
+
+        ids = [ key for key in by_key if key != 'None' ]
+
+        for start in range( 0,len( ids ),batch_size ):
+
+            sql = f'select {columns} from {db}.{Serializable.default_middleware}.{table}'
+            sql += f' WHERE {Serializable._generate_sql_clauses( filters=[ ( pk,ids[start:start + batch_size] ) ] )}'
+
+            for item in iQuery( ).execute(sql=sql,idempotent=True):
+
+                row = { str( key ).lower():val for key,val in item.items() }
+
+                for instance,vars in by_key.get( str( row.get( str( pk_var ).lower() ) ),[] ):
+
+                    for var,attr in vars.items():
+
+                        if attr not in instance.__dict__ and str( var ).lower() in row: # Never overwrites values set since the read
+                            instance.__dict__[attr] = row[ str( var ).lower() ]
+
+        for instance,vars in missing.values():
+
+            for var,attr in vars.items():
+                instance.__dict__.setdefault( attr,None ) # Rows deleted since the first read stay empty
+
+            instance._unloaded = { var:attr for var,attr in instance._unloaded_vars().items() if var not in vars }
+
+        return instances
+
     @_valid_mapping
     def get_from_json( 
         self, 
@@ -281,6 +480,123 @@ class Serializable(object):
         return cls
     
     
+    @classmethod
+    @_valid_class_mapping
+    def reload( cls, instances:list, query:Optional[iQuery] = None ):
+        
+        """
+        Truncates the associated table and inserts the instances in a single request
+
+        :param instances: Instances to insert once the table is truncated
+        :param query: iQuery to run on; pass the one from iQuery.transaction() to make the reload atomic
+        """
+
+        server,db,table,map = cls._get_class_vars()
+
+        statements = [ f'truncate table {server}.{cls.default_middleware}.{table}' ]
+
+        for instance in instances:
+
+            column_name = instance._get_vars()[3].get( '<pk>',None ) # Get primary key
+
+            if cls.CREATE_UUID_IF_NONE and isinstance( column_name,str ) and getattr( instance,column_name,None ) is None:
+                setattr( instance,column_name,instance._uuid() )
+
+            statements.append( instance.serialize_to_sql() )
+
+        ( query or iQuery() ).execute_many( statements=statements )
+
+        return cls
+    
+    @classmethod
+    def _load_watermarks( cls ):
+
+        """
+        Reads the persisted sync_since() watermarks
+        """
+
+        try:
+            with open( cls.watermark_path,'r' ) as file:
+                return json.load( file )
+        except ( FileNotFoundError, json.JSONDecodeError ):
+            return {}
+
+    @classmethod
+    def _save_watermark( cls, name:str, value:Any ):
+
+        """
+        Persists a sync_since() watermark; written to a uniquely named temp file first so a crash never truncates the store
+        and concurrent jobs never write into each other's temp file
+        """
+
+        watermarks = cls._load_watermarks()
+        watermarks[name] = value
+
+        with tempfile.NamedTemporaryFile( 'w',dir=os.path.dirname( os.path.abspath( cls.watermark_path ) ),suffix='.tmp',delete=False ) as file:
+            json.dump( watermarks,file,default=str )
+
+        os.replace( file.name,cls.watermark_path )
+
+    @classmethod
+    @_valid_class_mapping
+    def sync_since( 
+        cls, 
+        watermark_column:str, 
+        last_value:Any = None, 
+        store:Optional[dict] = None, 
+        columns:Optional[list] = None, 
+        watermark_name:Optional[str] = None 
+    ):
+
+        """
+        Fetches the rows changed since the last watermark and merges them into a store keyed by <pk>
+        Refresh cost scales with the number of changed rows instead of the table size
+
+        :param watermark_column: Column that increases whenever a row changes; Ex: updated_at
+        :param last_value: Watermark to sync from; defaults to the one persisted by the previous run
+        :param store: Dict the changed instances are merged into; defaults to the class's in-memory synced cache,
+            which ignores the persisted watermark while empty (Ex: in a new process) since it would skip unchanged rows
+        :param columns: Column or variable names to select, as in get_all(); the <pk> is always selected
+        :param watermark_name: Name the watermark is persisted under; defaults to [db].[table].[watermark_column]
+            Every caller-supplied store resumes from the watermark under its name, so give each store of a table its own name
+        :ret list: returns the changed instances
+        """
+
+        server,db,table,map = cls._get_class_vars()
+
+        name = watermark_name or f'{db}.{table}.{watermark_column}'
+        pk = map.get( '<pk>',None )
+        pk_var = map.get( pk,pk )
+        watermark_var = map.get( watermark_column,watermark_column )
+
+        if store is None:
+
+            if '_synced' not in cls.__dict__:
+                cls._synced = {}
+
+            store = cls._synced
+            name = watermark_name or f'{name}:{cls.__name__}._synced' # Kept apart from caller-supplied stores
+
+        # The default cache does not outlive the process, so it only trusts the persisted watermark once it holds rows
+        if last_value is None and ( store is not getattr( cls,'_synced',None ) or len( store ) > 0 ):
+            last_value = cls._load_watermarks().get( name,None )
+
+        filters = { watermark_column:{ 'since':last_value } } if last_value is not None else {} # >= so rows sharing the last watermark are not missed
+        columns = [ *columns,watermark_column,pk ] if columns else columns # The store is keyed on <pk>
+
+        instances = cls().get_all( columns=columns,**filters )
+
+        for instance in instances:
+            store[ getattr( instance,pk_var,None ) ] = instance
+
+        watermarks = [ getattr( instance,watermark_var,None ) for instance in instances ]
+        watermarks = [ watermark for watermark in watermarks if watermark is not None ]
+
+        if len( watermarks ) > 0:
+            cls._save_watermark( name=name,value=max( watermarks ) )
+
+        return instances
+    
     @classmethod
     @_valid_class_mapping
     def create_table( cls ):
@@ -360,75 +676,152 @@ class Serializable(object):
         return [ cls().get_from_json( data=row ) for row in rows ]
     
     @_valid_mapping
-    def get_all( self, **kwargs ):
+    def get_all( self, columns:Optional[list] = None, **kwargs ):
 
         """
         Queries objects from db and serializes them into instances of the parent class
         Grabs all items
 
         if kwargs are found, use them as WHERE clauses
+
+        :param columns: Column or variable names to select, the rest load on first access; '<deferred>' columns are skipped when empty
         """
 
         server,db,table,map = self._get_vars()
 
-        n_map = [ f'{key} as {val}' for key,val in map.items() if key not in Serializable.key_types ]
+        selected,unloaded = Serializable._projection( map=map,columns=columns,deferred=self._deferred_columns() )
+        n_map = [ f'{key} as {val}' for key,val in selected.items() ]
         columns = ','.join(n_map)
-        instances = []
         sql = f'select distinct {columns} from {self.resource_db}.{Serializable.default_middleware}.{self.resource_table}'
 
         if len( kwargs.items() ) > 0:
             sql += f' WHERE {Serializable._generate_sql_clauses( filters=kwargs.items() )}'
         
-        resp = iQuery( ).execute(sql=sql)
+        resp = iQuery( ).execute(sql=sql,idempotent=True)
+           
+        return self._hydrate( rows=resp,unloaded=unloaded )
 
-        for item in resp:
-            
-            instance = self.__class__( self )
+    def _hydrate( self, rows:list, unloaded:Optional[list] = None ):
+
+        """
+        Serializes query rows into new instances of the parent class
 
-            for key,val in item.items():
+        :param rows: Rows returned by iQuery
+        :param unloaded: Vars removed from each instance so they load on first access
+        """
 
-                if Serializable.OVERRIDE_UNDERSCORE_WITH_PROPERTY and hasattr( instance,f'_{key}'.lower() ):
-                    setattr(instance, f'_{key}'.lower() ,val)
-                else:
-                    setattr(instance, f'{key}'.lower() ,val)
+        instances = []
+
+        for item in rows:
+            
+            instance = self.__class__( self )
+            instance._set_from_row( item )
+            instance._mark_unloaded( unloaded or [] ) # Left for __getattr__ or load_deferred()
 
             instances.append( instance )
-           
+
         return instances
+
+    @staticmethod
+    def _read_partition( template, sql:str, unloaded:list ):
+
+        """
+        Runs one partition's query on its own pooled connection and hydrates the rows
+        Static so process pools can pickle it by reference
+        """
+
+        with iQuery.pooled() as query:
+            resp = query.execute(sql=sql,idempotent=True)
+
+        return template._hydrate( rows=resp,unloaded=unloaded )
+
+    @_valid_mapping
+    def iter_all_parallel( 
+        self, 
+        partitions:Optional[int] = None, 
+        workers:Optional[int] = None, 
+        processes:bool = False, 
+        columns:Optional[list] = None, 
+        **kwargs 
+    ):
+
+        """
+        Splits get_all() into hash ranges on <pk>, each queried on its own pooled connection and hydrated in a worker pool
+        Yields instances partition by partition as they complete, so ordering is not preserved
+
+        :param partitions: Number of hash ranges; defaults to the number of workers
+        :param workers: Pool size; defaults to the number of cores
+        :param processes: Hydrates in a process pool instead of a thread pool; the class must be picklable
+        :param columns: Column or variable names to select, as in get_all()
+        """
+
+        server,db,table,map = self._get_vars()
+
+        pk = map.get( '<pk>',None )
+
+        if not isinstance( pk,str ):
+            raise KeyError(f'Parallel reads require a <pk> mapping for class type ({type(self)})')
+
+        workers = workers or os.cpu_count() or 1
+        partitions = partitions or workers
+
+        selected,unloaded = Serializable._projection( map=map,columns=columns,deferred=self._deferred_columns() )
+        n_map = [ f'{key} as {val}' for key,val in selected.items() ]
+        columns = ','.join(n_map)
+        clauses = [ Serializable._generate_sql_clauses( filters=kwargs.items() ) ] if len( kwargs.items() ) > 0 else []
+        sql = f'select distinct {columns} from {db}.{Serializable.default_middleware}.{table}'
+
+        # Equal rows share a <pk> and therefore a partition, so per-partition distinct matches get_all()
+        queries = [ f'{sql} WHERE {" AND ".join( [ *clauses,f"mod(abs(hash({pk})),{partitions}) = {partition}" ] )}' for partition in range( partitions ) ]
+
+        Executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+        with Executor( max_workers=workers ) as executor:
+
+            futures = [ executor.submit( Serializable._read_partition,self,query,unloaded ) for query in queries ]
+
+            for future in as_completed( futures ):
+                yield from future.result()
+
+    def get_all_parallel( self, **kwargs ):
+
+        """
+        Merges iter_all_parallel() into one list; takes the same arguments
+        """
+
+        return list( self.iter_all_parallel( **kwargs ) )
     
     @_valid_mapping
-    def get( self, **kwargs ):
+    def get( self, columns:Optional[list] = None, **kwargs ):
 
         """
         Queries object from db and serializes it into an instance of the parent class
         Limited to one item
 
         if kwargs are found, use them as WHERE clauses
+
+        :param columns: Column or variable names to select, the rest load on first access; '<deferred>' columns are skipped when empty
         """
 
         server,db,table,map = self._get_vars()
 
-        n_map = [ f'{key} as {val}' for key,val in map.items() if key not in Serializable.key_types ]
+        selected,unloaded = Serializable._projection( map=map,columns=columns,deferred=self._deferred_columns() )
+        n_map = [ f'{key} as {val}' for key,val in selected.items() ]
         columns = ','.join(n_map)
         
         sql = f'select top 1 {columns} from {db}.{Serializable.default_middleware}.{table}'
         sql += f' WHERE {Serializable._generate_sql_clauses( filters=kwargs.items() )}' if len( kwargs.items() ) > 0 else self._key_clauses
 
         try:
-            resp = iQuery( ).execute(sql=sql)
+            resp = iQuery( ).execute(sql=sql,idempotent=True)
         except Exception as SQLException:
             resp = []
 
         if not isinstance( resp,list ) or ( isinstance( resp,list ) and len(resp) < 1 ) or ( isinstance( resp,list ) and len( resp ) > 0 and not isinstance( resp[0],dict ) ):
             return self
 
-        for key,val in resp[0].items():
-
-            if Serializable.OVERRIDE_UNDERSCORE_WITH_PROPERTY and hasattr( self,f'_{key}'.lower() ):
-                setattr(self, f'_{key}'.lower() ,val)
-            else:
-                setattr(self, f'{key}'.lower() ,val)
-
+        self._set_from_row( resp[0] )
+        self._mark_unloaded( unloaded ) # Left for __getattr__ or load_deferred()
             
         return self
 
@@ -443,15 +836,34 @@ class Serializable(object):
 
         server,db,table,map = self._get_vars()
         
-        vars = [ val for key,val in map.items() if key not in Serializable.key_types ]
-        override = lambda a : a if a not in vars else getattr( self,a,a )
-        new_html = html
+        vars = tuple( val for key,val in map.items() if key not in Serializable.key_types )
 
-        for var in vars:
+        return compile_template( html=html,names=vars ).render( self )
 
-            new_html = new_html.replace( f'@{var}@', str( override( var ) ) )
+    @staticmethod
+    def serialize_many_to_html( instances, html:str = None ):
 
-        return new_html
+        """
+        Lazily pivots a list or iterator of instances into the HTML target, one string per instance
+        The mapping is resolved from the first instance and the template is parsed once for the whole batch
+
+        :param instances: Instances of one class
+        :param html: The HTML to which we will serialize
+        """
+
+        instances = iter( instances )
+        first = next( instances,None )
+
+        if first is None:
+            return
+
+        server,db,table,map = first._get_vars()
+
+        vars = tuple( val for key,val in map.items() if key not in Serializable.key_types )
+        template = compile_template( html=html,names=vars )
+
+        yield template.render( first )
+        yield from template.render_many( instances )
     
     @_valid_mapping
     def serialize_to_json(self):
@@ -490,12 +902,114 @@ class Serializable(object):
 
         else:
 
-            clauses = [ f'{key} = {val}' for key,val in kwargs.items() ]
-            sql = f'delete from {db}.{Serializable.default_middleware}.{table} where { " AND ".join( clauses ) }'
+            sql = f'delete from {db}.{Serializable.default_middleware}.{table} WHERE {Serializable._generate_sql_clauses( filters=kwargs.items() )}'
             iQuery().execute( sql=sql )
 
             return self
 
+    @staticmethod
+    def _affected_rows( rows:list ):
+
+        """
+        Sums the affected row counts Snowflake returns for DML; Ex: [{'number of rows deleted': 3}]
+        """
+
+        return sum( int( val ) for row in rows for key,val in row.items() if str( key ).lower().startswith( 'number of rows' ) )
+
+    @classmethod
+    @_valid_class_mapping
+    def delete_many( 
+        cls, 
+        objs_or_ids:list, 
+        batch_size:int = 1000, 
+        query:Optional[iQuery] = None 
+    ):
+
+        """
+        Deletes many rows by key, batching keys into IN predicates (or OR'd composite key predicates)
+        Every batch is sent in a single request
+
+        :param objs_or_ids: Instances, <pk> values, or tuples of <ck> values; raises ValueError if any key value is None
+        :param batch_size: Number of keys per delete statement
+        :param query: iQuery to run on; pass the one from iQuery.transaction() to make the delete atomic
+        :ret int: returns the number of rows deleted
+        """
+
+        server,db,table,map = cls._get_class_vars()
+
+        key = map.get( '<pk>',None ) or map.get( '<ck>',None )
+        key_columns = [ key ] if isinstance( key,str ) else list( key or [] )
+
+        if len( key_columns ) == 0:
+            raise KeyError(f'No <pk> or <ck> mapping found for class type ({cls})')
+
+        keys = []
+
+        for item in objs_or_ids:
+
+            if isinstance( item,Serializable ):
+                keys.append( tuple( getattr( item,map.get( column,column ),None ) for column in key_columns ) )
+            else:
+                keys.append( tuple( item ) if isinstance( item,( list,tuple ) ) else ( item, ) )
+
+            if len( keys[-1] ) != len( key_columns ) or None in keys[-1]:
+                # A None key would match "is null" rows (or break the IN list) instead of the intended row
+                raise ValueError(f'delete_many() key {keys[-1]} does not match the key columns {key_columns} for class type ({cls})')
+
+        statements = []
+
+        for start in range( 0,len( keys ),batch_size ):
+
+            batch = keys[start:start + batch_size]
+
+            if len( key_columns ) == 1:
+                clause = Serializable._generate_sql_clauses( filters=[ ( key_columns[0],[ values[0] for values in batch ] ) ] )
+            else:
+                groups = [ [ Serializable._generate_sql_clauses( filters=[ ( column,value ) ] ) for column,value in zip( key_columns,values ) ] for values in batch ]
+
+                if any( '' in group for group in groups ):
+                    raise ValueError(f'delete_many() cannot build a clause for every key column {key_columns} for class type ({cls})')
+
+                clause = ' OR '.join( f'({" AND ".join( group )})' for group in groups )
+
+            statements.append( f'delete from {db}.{Serializable.default_middleware}.{table} WHERE {clause}' )
+
+        results = ( query or iQuery() ).execute_many( statements=statements )
+
+        return sum( Serializable._affected_rows( rows ) for rows in results )
+
+    @classmethod
+    @_valid_class_mapping
+    def delete_where( cls, query:Optional[iQuery] = None, **filters ):
+
+        """
+        Deletes every row matching the filters; supports the same grammar as get_all() (IN, between/before/after/since, null)
+        Raises ValueError rather than widening the delete when a filter cannot be turned into a clause
+
+        :param query: iQuery to run on; pass the one from iQuery.transaction() to make the delete atomic
+        :ret int: returns the number of rows deleted
+        """
+
+        server,db,table,map = cls._get_class_vars()
+
+        if len( filters.items() ) == 0:
+            raise ValueError(f'delete_where() requires at least one filter for class type ({cls}); use truncate() to clear the table')
+
+        clauses = []
+
+        for key,val in filters.items():
+
+            clause = Serializable._generate_sql_clauses( filters=[ ( key,val ) ] )
+
+            if clause == '' or ( isinstance( val,( list,tuple ) ) and len( val ) == 0 ):
+                raise ValueError(f'delete_where() cannot build a clause for filter {key}={val!r} on class type ({cls})')
+
+            clauses.append( clause )
+
+        sql = f'delete from {db}.{Serializable.default_middleware}.{table} WHERE {" AND ".join( clauses )}'
+
+        return Serializable._affected_rows( ( query or iQuery() ).execute( sql=sql ) )
+
     @_valid_mapping
     def insert(self):
 
@@ -624,6 +1138,9 @@ class Serializable(object):
                 elif "after" in val:
                     after_date = val["after"]
                     clause_parts.append(f"{key} > '{after_date}'")
+                elif "since" in val:
+                    since_date = val["since"]
+                    clause_parts.append(f"{key} >= '{since_date}'")
 
             elif isinstance(val, (list, tuple)):
                 # Assuming val is a list of values for IN clause
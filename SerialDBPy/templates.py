@@ -0,0 +1,60 @@
+from functools import lru_cache
+from typing import Iterable
+
+import re
+
+class CompiledTemplate(object):
+
+    """
+    HTML template parsed once into literal segments and @var@ placeholders
+
+    Rendering fills the placeholders and joins the segments once per instance,
+    instead of one full str.replace pass over the HTML per mapped variable
+
+    :param html: The HTML to which we will serialize
+    :param names: Variable names whose @var@ placeholders are filled; any other @text@ is left untouched
+    """
+
+    def __init__( self, html:str, names:tuple ):
+
+        self.html = html
+        self.names = tuple( names )
+
+        if len( self.names ) > 0:
+            # Longest names first so @name_full@ is never cut short by @name@
+            pattern = '|'.join( re.escape( name ) for name in sorted( self.names,key=len,reverse=True ) )
+            self.segments = re.split( f'@({pattern})@',html ) # Literals at even indexes, names at odd indexes
+        else:
+            self.segments = [ html ]
+
+        self.placeholders = self.segments[1::2]
+
+    def render( self, instance ):
+
+        """
+        Renders one instance; unset variables render as their own name
+        """
+
+        segments = self.segments[:]
+        segments[1::2] = [ str( getattr( instance,name,name ) ) for name in self.placeholders ]
+
+        return ''.join( segments )
+
+    def render_many( self, instances:Iterable ):
+
+        """
+        Lazily renders a list or iterator of instances, one string per instance
+        """
+
+        for instance in instances:
+            yield self.render( instance )
+
+
+@lru_cache( maxsize=256 )
+def compile_template( html:str, names:tuple ):
+
+    """
+    Returns the CompiledTemplate for the HTML, cached by template text and variable names
+    """
+
+    return CompiledTemplate( html=html,names=names )
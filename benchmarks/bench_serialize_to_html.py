@@ -0,0 +1,68 @@
+"""
+Compares serialize_to_html's previous per-object str.replace loop with the compiled template path
+
+Requires the same environment variables as SerialDBPy itself, since importing the package opens a connection
+
+    python benchmarks/bench_serialize_to_html.py
+"""
+
+from SerialDBPy import Serializable
+
+import timeit
+
+class Row( Serializable ):
+
+    resource_db = 'bench_db'
+    resource_table = 'bench_table'
+    resource_map = { '<pk>':'id',**{ f'col_{index}':f'col_{index}' for index in range( 12 ) },'id':'id' }
+
+    def __init__( self, *args ):
+
+        self.id = None
+
+        for index in range( 12 ):
+            setattr( self,f'col_{index}',f'value {index}' )
+
+
+HTML = '<tr>' + ''.join( f'<td class="c{index}">@col_{index}@</td>' for index in range( 12 ) ) + '<td>@id@</td></tr>\n'
+ROWS = 10000
+
+
+@Serializable._valid_mapping
+def replace_loop( instance, html:str ):
+
+    # serialize_to_html before templates were compiled
+    server,db,table,map = instance._get_vars()
+
+    vars = [ val for key,val in map.items() if key not in Serializable.key_types ]
+    override = lambda a : a if a not in vars else getattr( instance,a,a )
+    new_html = html
+
+    for var in vars:
+        new_html = new_html.replace( f'@{var}@', str( override( var ) ) )
+
+    return new_html
+
+
+def main():
+
+    instances = [ Row() for _ in range( ROWS ) ]
+
+    for index,instance in enumerate( instances ):
+        instance.id = index
+
+    assert [ replace_loop( instance,HTML ) for instance in instances[:10] ] == list( Serializable.serialize_many_to_html( instances[:10],HTML ) )
+
+    cases = {
+        'replace loop (previous)': lambda: ''.join( replace_loop( instance,HTML ) for instance in instances ),
+        'serialize_to_html (compiled)': lambda: ''.join( instance.serialize_to_html( HTML ) for instance in instances ),
+        'serialize_many_to_html (batch)': lambda: ''.join( Serializable.serialize_many_to_html( instances,HTML ) ),
+    }
+
+    for name,case in cases.items():
+        best = min( timeit.repeat( case,number=1,repeat=5 ) )
+        print( f'{name:<34} {best * 1000:8.1f} ms for {ROWS} rows' )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+import pytest
+
+connector = pytest.importorskip( 'snowflake.connector' )
+
+_connect = connector.connect
+connector.connect = lambda **kwargs: None # SerialDBPy connects on import; every query below goes through the patched iQuery.execute
+
+from SerialDBPy import Serializable, iQuery
+
+connector.connect = _connect
+
+
+class Person( Serializable ):
+
+    resource_db = 'db'
+    resource_table = 'people'
+    resource_map = { '<pk>':'id','<deferred>':['bio'],'id':'id','name':'name','age':'age','bio':'bio' }
+
+    def __init__( self, *args ):
+
+        self.id = None
+        self.name = 'DEFAULT'
+        self.age = None
+        self.bio = None
+
+
+class Account( Serializable ):
+
+    resource_db = 'db'
+    resource_table = 'accounts'
+    resource_map = { '<pk>':'id','id':'id','name':'name','age':'age' }
+
+    def __init__( self, *args ):
+
+        self.id = None
+        self._name = 'DEFAULT'
+        self.age = None
+
+    @property
+    def name( self ):
+        return self._name
+
+    @name.setter
+    def name( self, value ):
+        self._name = value
+
+
+@pytest.fixture
+def queries( monkeypatch ):
+
+    """
+    Records every SQL statement and answers them in order from queries.rows
+    """
+
+    class Queries( list ):
+        rows = []
+
+    sent = Queries()
+
+    def execute( self, sql:str = None, timeout:int = None, idempotent:bool = False ):
+        sent.append( sql )
+        return sent.rows.pop( 0 ) if sent.rows else []
+
+    monkeypatch.setattr( iQuery,'execute',execute )
+
+    return sent
+
+
+def test_projection_without_key_keeps_primary_key( queries ):
+
+    queries.rows = [ [ { 'NAME':'a','ID':'1' } ] ]
+
+    people = Person().get_all( columns=['name'] )
+
+    assert 'id as id' in queries[0]
+    assert people[0].id == '1'
+    assert people[0].name == 'a'
+    assert len( queries ) == 1
+
+
+def test_projected_out_column_loads_on_access( queries ):
+
+    queries.rows = [ [ { 'ID':'1','NAME':'a' } ],[ { 'ID':'1','AGE':40 } ] ]
+
+    person = Person().get( columns=['id','name'],id='1' )
+
+    assert 'age' not in person.__dict__
+    assert person.age == 40
+    assert queries[1] == "select id as id,age as age,bio as bio from db..people WHERE id IN ('1')" # Every unloaded column in one query
+
+
+def test_deferred_columns_batch_load_without_overwriting( queries ):
+
+    queries.rows = [ [ { 'ID':'1','NAME':'a','AGE':1 },{ 'ID':'2','NAME':'b','AGE':2 } ],[ { 'ID':'1','BIO':'n1' },{ 'ID':'2','BIO':'n2' } ] ]
+
+    people = Person().get_all()
+    people[1].bio = 'mine'
+
+    assert 'bio' not in queries[0]
+
+    Person.load_deferred( people )
+
+    assert [ person.bio for person in people ] == [ 'n1','mine' ]
+    assert queries[1] == "select id as id,bio as bio from db..people WHERE id IN ('1')"
+
+
+def test_underscore_property_is_loaded_before_serialize_to_sql( queries ):
+
+    queries.rows = [ [ { 'ID':'k1','AGE':3 } ],[ { 'ID':'k1','NAME':'real' } ] ]
+
+    account = Account().get_all( columns=['id','age'] )[0]
+
+    assert '_name' not in account.__dict__
+    assert "'real'" in account.serialize_to_sql()
+    assert "'DEFAULT'" not in account.serialize_to_sql()
+
+
+def test_new_instances_never_lazy_load( queries ):
+
+    class Draft( Person ):
+
+        def __init__( self, *args ):
+            self.id = None
+            self.name = 'n'
+
+    draft = Draft()
+
+    with pytest.raises( AttributeError ):
+        draft.bio
+
+    assert queries == []